@@ -1,6 +1,61 @@
 import argparse
+import sys
 
-from frankenfont.create import create_custom_font, install_font
+# Subcommand handlers import their implementation on demand, so that `--help`
+# and lightweight commands never load fontTools or Pillow.
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer argument"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def run_create(args: argparse.Namespace) -> None:
+    from frankenfont.create import create_custom_font
+
+    font_paths = [create_custom_font(config) for config in args.config]
+
+    if args.install:
+        from frankenfont.install import install_fonts
+
+        try:
+            install_fonts(font_paths, args.system)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Error: {e}")
+
+
+def run_install(args: argparse.Namespace) -> None:
+    from frankenfont.install import install_fonts
+
+    try:
+        install_fonts(args.fonts, args.system)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Error: {e}")
+
+
+def run_preview(args: argparse.Namespace) -> None:
+    import logging
+
+    from frankenfont.preview import preview_config, write_specimen
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    if args.specimen:
+        try:
+            write_specimen(
+                args.config,
+                args.specimen,
+                columns=args.columns,
+                rows=args.rows,
+                cell_size=args.cell_size,
+                workers=args.workers,
+            )
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+    else:
+        preview_config(args.config)
 
 
 def main():
@@ -16,19 +71,59 @@ def main():
         "create", help="Create a custom font based on configuration"
     )
     create_parser.add_argument(
-        "config", type=str, help="Path to the TOML configuration file"
+        "config", type=str, nargs="+", help="Path to the TOML configuration file(s)"
     )
     create_parser.add_argument(
-        "-i", "--install", action="store_true", help="Install the font after creation"
+        "-i", "--install", action="store_true", help="Install the fonts after creation"
     )
+    create_parser.add_argument(
+        "--system", action="store_true", help="Install system-wide instead of per user"
+    )
+    create_parser.set_defaults(handler=run_create)
 
-    args = parser.parse_args()
+    # `install` command
+    install_parser = subparsers.add_parser(
+        "install", help="Install font files, skipping ones already installed"
+    )
+    install_parser.add_argument(
+        "fonts", type=str, nargs="+", help="Paths to the font files to install"
+    )
+    install_parser.add_argument(
+        "--system", action="store_true", help="Install system-wide instead of per user"
+    )
+    install_parser.set_defaults(handler=run_install)
+
+    # `preview` command
+    preview_parser = subparsers.add_parser(
+        "preview", help="Preview the glyphs mapped by a configuration"
+    )
+    preview_parser.add_argument(
+        "config", type=str, help="Path to the TOML or JSON configuration file"
+    )
+    preview_parser.add_argument(
+        "--specimen",
+        type=str,
+        metavar="OUTPUT_DIR",
+        help="Write a tiled specimen of every mapped glyph to this directory",
+    )
+    preview_parser.add_argument(
+        "--columns", type=positive_int, default=16, help="Specimen cells per tile row"
+    )
+    preview_parser.add_argument(
+        "--rows", type=positive_int, default=16, help="Specimen cell rows per tile"
+    )
+    preview_parser.add_argument(
+        "--cell-size", type=positive_int, default=80, help="Specimen cell size in pixels"
+    )
+    preview_parser.add_argument(
+        "--workers", type=positive_int, help="Number of threads rendering specimen tiles"
+    )
+    preview_parser.set_defaults(handler=run_preview)
 
-    if args.command == "create":
-        font_path = create_custom_font(args.config)
+    args = parser.parse_args()
 
-        if args.install:
-            install_font(font_path)
+    if args.command is not None:
+        args.handler(args)
 
 
 if __name__ == "__main__":
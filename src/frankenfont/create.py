@@ -1,11 +1,13 @@
 import os
-import platform
-import subprocess
+import tomllib
 from shutil import copyfile
 
-import toml
 from fontTools.ttLib import TTFont
 
+from frankenfont.hashing import file_hash
+from frankenfont.install import install_fonts
+from frankenfont.outlines import DEFAULT_TOLERANCE, load_cff_glyph
+
 
 def load_config(config_path: str) -> dict:
     """Load and parse a TOML configuration file.
@@ -16,29 +18,55 @@ def load_config(config_path: str) -> dict:
     Returns:
         Dict containing the parsed configuration
     """
-    return toml.load(config_path)
+    with open(config_path, "rb") as f:
+        return tomllib.load(f)
 
 
-def merge_glyphs(base_font: TTFont, symbol_font: str, symbols: list[str]) -> None:
+def merge_glyphs(
+    base_font: TTFont,
+    symbol_font: str,
+    symbols: list[str],
+    tolerance: float = DEFAULT_TOLERANCE,
+    cache_dir: str | None = None,
+) -> None:
     """Merge specified glyphs from symbol font into base font.
     
     Args:
         base_font: The target TTFont object to merge glyphs into
         symbol_font: Path to the font containing glyphs to copy
         symbols: List of symbols/characters to copy
+        tolerance: Maximum error when converting CFF outlines, in font units
+        cache_dir: Directory for cached CFF conversions
+        
+    Note:
+        CFF- and CFF2-flavored sources are converted to quadratic outlines,
+        and only the requested glyphs are converted. Conversions are cached
+        on disk.
     """
     symbol_font_glyphs = TTFont(symbol_font)
     cmap = symbol_font_glyphs["cmap"].getBestCmap()
-    glyf = symbol_font_glyphs["glyf"]
     hmtx = symbol_font_glyphs["hmtx"]
 
+    if "glyf" not in symbol_font_glyphs:
+        source_hash = file_hash(symbol_font)
+        glyph_names = set(symbol_font_glyphs.getGlyphOrder())
+
+        def get_glyph(glyph_name):
+            return load_cff_glyph(
+                symbol_font_glyphs, source_hash, glyph_name, tolerance, cache_dir
+            )
+    else:
+        glyf = symbol_font_glyphs["glyf"]
+        glyph_names = glyf.keys()
+        get_glyph = glyf.__getitem__
+
     for symbol in symbols:
         code_point = ord(symbol)
         if code_point in cmap:
             glyph_name = cmap[code_point]
-            if glyph_name in glyf.keys():
+            if glyph_name in glyph_names:
                 # Copy glyph outline
-                base_font["glyf"][glyph_name] = glyf[glyph_name]
+                base_font["glyf"][glyph_name] = get_glyph(glyph_name)
                 # Copy horizontal metrics
                 base_font["hmtx"][glyph_name] = hmtx[glyph_name]
                 # Update character mapping
@@ -68,32 +96,28 @@ def create_custom_font(config_path: str) -> str:
     os.makedirs(output_dir, exist_ok=True)
     copyfile(base_font_path, output_path)
     base_font = TTFont(output_path)
+    cache_dir = config["fonts"].get("cache_directory")
 
     for replacement in config["replacements"]:
         symbols = replacement["symbols"]
         font_path = replacement["font"]
-        merge_glyphs(base_font, font_path, symbols)
+        tolerance = replacement.get("tolerance", DEFAULT_TOLERANCE)
+        merge_glyphs(base_font, font_path, symbols, tolerance, cache_dir)
 
     base_font.save(output_path)
     print(f"Custom font saved to {output_path}")
     return output_path
 
 
-def install_font(font_path: str) -> None:
-    """Install a font file into the system fonts directory.
+def install_font(font_path: str, system: bool = False) -> None:
+    """Install a single font file into the user or system fonts directory.
     
     Args:
         font_path: Path to the font file to install
+        system: Install system-wide instead of for the current user
         
     Note:
-        Requires appropriate permissions to write to system directories.
-        May need sudo/admin rights on some systems.
+        Use `install_fonts` to install many fonts with a single font-cache
+        refresh.
     """
-    system = platform.system()
-    if system == "Windows":
-        subprocess.run(f"copy {font_path} %WINDIR%\\Fonts", shell=True)
-    elif system == "Darwin":
-        subprocess.run(["cp", font_path, "~/Library/Fonts/"])
-    elif system == "Linux":
-        subprocess.run(["sudo", "cp", font_path, "/usr/local/share/fonts/"])
-    print("Font installed. You may need to restart applications to see the changes.")
+    install_fonts([font_path], system)
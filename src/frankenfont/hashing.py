@@ -0,0 +1,7 @@
+import hashlib
+
+
+def file_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
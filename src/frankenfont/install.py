@@ -0,0 +1,147 @@
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+
+from frankenfont.hashing import file_hash
+
+
+def font_directory(system: bool = False) -> str:
+    """Return the font directory for the current platform.
+
+    Args:
+        system: Use the system-wide directory instead of the user's
+
+    Returns:
+        Path to the font directory
+
+    Raises:
+        OSError: If the platform is not supported
+    """
+    name = platform.system()
+    if name == "Windows":
+        if system:
+            return os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")
+        return os.path.join(
+            os.environ["LOCALAPPDATA"], "Microsoft", "Windows", "Fonts"
+        )
+    elif name == "Darwin":
+        return "/Library/Fonts" if system else os.path.expanduser("~/Library/Fonts")
+    elif name == "Linux":
+        if system:
+            return "/usr/local/share/fonts"
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(
+            "~/.local/share"
+        )
+        return os.path.join(data_home, "fonts")
+    raise OSError(f"Unsupported platform: {name}")
+
+
+def is_installed(font_path: str, target_path: str) -> bool:
+    """Check whether target_path already holds an identical copy of font_path"""
+    if not os.path.exists(target_path):
+        return False
+    if os.path.getsize(font_path) != os.path.getsize(target_path):
+        return False
+    return file_hash(font_path) == file_hash(target_path)
+
+
+def copy_atomic(font_path: str, target_path: str) -> None:
+    """Copy a font so that target_path is never left partially written"""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target_path), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as dst, open(font_path, "rb") as src:
+            shutil.copyfileobj(src, dst)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def register_windows_font(target_path: str, system: bool = False) -> None:
+    """Register an installed font in the Windows registry.
+
+    Windows only loads fonts listed under the `Fonts` registry key, per user
+    for fonts in the user's directory and per machine for the system one.
+    """
+    import winreg
+
+    root = winreg.HKEY_LOCAL_MACHINE if system else winreg.HKEY_CURRENT_USER
+    name = os.path.splitext(os.path.basename(target_path))[0]
+    kind = "OpenType" if target_path.lower().endswith(".otf") else "TrueType"
+    # System fonts are registered by file name, per-user fonts by full path
+    value = os.path.basename(target_path) if system else target_path
+    with winreg.CreateKey(
+        root, r"Software\Microsoft\Windows NT\CurrentVersion\Fonts"
+    ) as key:
+        winreg.SetValueEx(key, f"{name} ({kind})", 0, winreg.REG_SZ, value)
+
+
+def refresh_font_cache(directory: str) -> None:
+    """Rebuild the fontconfig cache for a single directory, if fc-cache exists"""
+    fc_cache = shutil.which("fc-cache")
+    if fc_cache is None:
+        return
+    subprocess.run([fc_cache, "-f", directory], check=True)
+
+
+def install_fonts(font_paths: list[str], system: bool = False) -> list[str]:
+    """Install font files into the user or system fonts directory.
+
+    Fonts whose content matches what is already installed are skipped.
+    The font cache is refreshed once, after all fonts have been copied.
+
+    Args:
+        font_paths: Paths to the font files to install
+        system: Install system-wide instead of for the current user
+
+    Returns:
+        Paths of the fonts that were newly installed or updated
+
+    Raises:
+        FileNotFoundError: If any font path is missing or not a file
+        ValueError: If two fonts share a file name and would overwrite
+            each other
+
+    Note:
+        System-wide installation requires write access to the system
+        fonts directory, e.g. running with sudo/admin rights.
+    """
+    # Validate the whole batch before copying anything
+    missing = [font_path for font_path in font_paths if not os.path.isfile(font_path)]
+    if missing:
+        raise FileNotFoundError(f"Font files not found: {', '.join(missing)}")
+
+    names = [os.path.basename(font_path) for font_path in font_paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Fonts share a file name: {', '.join(duplicates)}")
+
+    directory = font_directory(system)
+    os.makedirs(directory, exist_ok=True)
+
+    installed = []
+    try:
+        for font_path in font_paths:
+            target_path = os.path.join(directory, os.path.basename(font_path))
+            up_to_date = is_installed(font_path, target_path)
+            if not up_to_date:
+                copy_atomic(font_path, target_path)
+            if platform.system() == "Windows":
+                # Registering is idempotent and repairs copies never registered
+                register_windows_font(target_path, system)
+            if up_to_date:
+                print(f"Already installed: {target_path}")
+                continue
+            print(f"Installed {font_path} to {target_path}")
+            installed.append(target_path)
+    finally:
+        # Fonts copied before a failure still need their cache refresh
+        if installed:
+            refresh_font_cache(directory)
+            print("You may need to restart applications to see the changes.")
+    return installed
@@ -0,0 +1,93 @@
+import os
+import struct
+import tempfile
+from pathlib import Path
+from urllib.parse import quote
+
+from fontTools.pens.cu2quPen import Cu2QuPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+DEFAULT_TOLERANCE = 1.0
+
+
+def default_cache_dir() -> str:
+    """Return the directory used to cache converted outlines"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "frankenfont", "outlines")
+
+
+def cache_path(cache_dir: str, source_hash: str, glyph_name: str, tolerance: float) -> Path:
+    """Return the cache file for a glyph converted from a given source font"""
+    file_name = f"{quote(glyph_name, safe='')}@{float(tolerance)}.glyf"
+    return Path(cache_dir) / source_hash / file_name
+
+
+def convert_cff_glyph(font: TTFont, glyph_name: str, tolerance: float) -> Glyph:
+    """Convert a cubic CFF or CFF2 glyph into a quadratic TrueType glyph.
+
+    Args:
+        font: The CFF- or CFF2-flavored source font
+        glyph_name: Name of the glyph to convert
+        tolerance: Maximum approximation error, in font units
+
+    Returns:
+        The converted glyph, suitable for a `glyf` table
+    """
+    pen = TTGlyphPen(None)
+    font.getGlyphSet()[glyph_name].draw(
+        Cu2QuPen(pen, tolerance, reverse_direction=True)
+    )
+    return pen.glyph()
+
+
+def load_cff_glyph(
+    font: TTFont,
+    source_hash: str,
+    glyph_name: str,
+    tolerance: float = DEFAULT_TOLERANCE,
+    cache_dir: str | None = None,
+) -> Glyph:
+    """Load a converted CFF glyph, converting and caching it on a miss.
+
+    Converted glyphs are stored in their compiled `glyf` form, keyed by the
+    source font hash, glyph name and tolerance.
+
+    Args:
+        font: The CFF- or CFF2-flavored source font
+        source_hash: Content hash of the source font file
+        glyph_name: Name of the glyph to load
+        tolerance: Maximum approximation error, in font units
+        cache_dir: Cache directory, defaults to `default_cache_dir()`
+
+    Returns:
+        The quadratic TrueType glyph
+    """
+    path = cache_path(
+        cache_dir or default_cache_dir(), source_hash, glyph_name, tolerance
+    )
+    if path.exists():
+        glyph = Glyph(path.read_bytes())
+        try:
+            # Glyphs decode lazily, so expand now to catch corrupt entries
+            glyph.expand(None)
+            return glyph
+        except (struct.error, ValueError, IndexError):
+            # Treat an undecodable entry as a miss and convert again
+            path.unlink()
+
+    glyph = convert_cff_glyph(font, glyph_name, tolerance)
+    data = glyph.compile(None)
+
+    # Write atomically so concurrent builds never read a partial entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return Glyph(data)
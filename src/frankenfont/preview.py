@@ -5,19 +5,18 @@ import os
 import random
 import sys
 import tempfile
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import toml
 from PIL import Image, ImageDraw, ImageFont
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
-
 
 def load_config(config_path: str) -> dict:
     """Load and parse the config file"""
     if config_path.endswith(".toml"):
-        return toml.load(config_path)
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
     elif config_path.endswith(".json"):
         with open(config_path) as f:
             return json.load(f)
@@ -194,7 +193,146 @@ def preview_config(config_path: str) -> None:
     print("Font preview image has been displayed.")
 
 
+# Smallest specimen cell that leaves room for both the glyph and its label
+MIN_CELL_SIZE = 16
+
+
+def collect_specimen_glyphs(config: dict, config_dir: Path) -> list[tuple[int, str]]:
+    """Collect every mapped glyph with the font that supplies it, ordered by code point
+
+    Later replacements win over earlier ones, matching the order in which
+    glyphs are merged into the output font.
+    """
+    glyph_fonts = {}
+    for replacement in config.get("replacements", []):
+        font_path = str(config_dir / replacement["font"])
+        for glyph in replacement["glyphs"]:
+            if len(glyph) != 1:
+                logging.warning(f"Skipping glyph name '{glyph}' in specimen")
+                continue
+            glyph_fonts[ord(glyph)] = font_path
+    return sorted(glyph_fonts.items())
+
+
+def render_specimen_tile(
+    tile_index: int,
+    entries: list[tuple[int, str]],
+    output_dir: str,
+    label_font_path: str,
+    columns: int = 16,
+    cell_size: int = 80,
+) -> str:
+    """Render one tile of the specimen grid and write it to disk
+
+    Fonts are loaded per tile because FreeType faces must not be shared
+    between threads.
+    """
+    glyph_size = cell_size // 2
+    label_size = max(cell_size // 8, 8)
+    fonts = {}
+    try:
+        label_font = ImageFont.truetype(label_font_path, size=label_size)
+    except OSError:
+        logging.warning(f"Error loading label font from {label_font_path}, using default")
+        label_font = ImageFont.load_default()
+
+    rows = -(-len(entries) // columns)
+    image = Image.new("RGB", (columns * cell_size, rows * cell_size), color="white")
+    draw = ImageDraw.Draw(image)
+
+    for i, (code_point, font_path) in enumerate(entries):
+        if font_path not in fonts:
+            fonts[font_path] = ImageFont.truetype(font_path, size=glyph_size)
+        x = (i % columns) * cell_size
+        y = (i // columns) * cell_size
+        draw.rectangle(
+            (x, y, x + cell_size - 1, y + cell_size - 1), outline="lightgray"
+        )
+        draw.text(
+            (x + cell_size // 2, y + cell_size * 2 // 5),
+            chr(code_point),
+            font=fonts[font_path],
+            fill="black",
+            anchor="mm",
+        )
+        draw.text(
+            (x + cell_size // 2, y + cell_size - 4),
+            f"U+{code_point:04X}",
+            font=label_font,
+            fill="gray",
+            anchor="ms",
+        )
+
+    tile_path = os.path.join(output_dir, f"specimen_{tile_index:04d}.png")
+    image.save(tile_path)
+    image.close()
+    return tile_path
+
+
+def write_specimen(
+    config_path: str,
+    output_dir: str,
+    columns: int = 16,
+    rows: int = 16,
+    cell_size: int = 80,
+    workers: int | None = None,
+) -> list[str]:
+    """Write a codepoint-ordered specimen of every mapped glyph as PNG tiles
+
+    The grid is split into tiles of ``columns`` x ``rows`` cells which are
+    rendered concurrently and saved as soon as they are finished, so only
+    one tile per worker is held in memory at a time.
+
+    Returns:
+        Paths of the written tiles, in grid order
+
+    Raises:
+        ValueError: If the grid dimensions are not positive or the cell size
+            is below MIN_CELL_SIZE
+        SystemExit: If a replacement font cannot be loaded
+    """
+    if columns < 1 or rows < 1:
+        raise ValueError("Specimen columns and rows must be positive")
+    if cell_size < MIN_CELL_SIZE:
+        raise ValueError(f"Specimen cell size must be at least {MIN_CELL_SIZE}")
+
+    config = load_config(config_path)
+    config_dir = Path(config_path).parent
+    entries = collect_specimen_glyphs(config, config_dir)
+    logging.info(f"Rendering specimen of {len(entries)} glyphs from {config_path}")
+
+    # Check fonts up front, errors raised inside worker threads are opaque
+    for font_path in sorted({font_path for _, font_path in entries}):
+        try:
+            ImageFont.truetype(font_path, size=cell_size // 2)
+        except OSError:
+            logging.error(f"Error loading replacement font from {font_path}")
+            sys.exit(1)
+
+    os.makedirs(output_dir, exist_ok=True)
+    tile_length = columns * rows
+    tiles = [
+        entries[start : start + tile_length]
+        for start in range(0, len(entries), tile_length)
+    ]
+    label_font_path = str(config_dir / config["fonts"]["base"])
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        tile_paths = list(
+            executor.map(
+                lambda tile: render_specimen_tile(
+                    tile[0], tile[1], output_dir, label_font_path, columns, cell_size
+                ),
+                enumerate(tiles),
+            )
+        )
+
+    logging.info(f"Wrote {len(tile_paths)} specimen tiles to {output_dir}")
+    return tile_paths
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     if len(sys.argv) > 1:
         preview_config(sys.argv[1])
     else:
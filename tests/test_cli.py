@@ -1,4 +1,6 @@
 import os
+import subprocess
+import time
 
 import pytest
 
@@ -34,15 +36,100 @@ def test_cli_create_with_install(monkeypatch, capsys):
     test_args = ["create", CONFIG_PATH, "--install"]
     monkeypatch.setattr("sys.argv", ["frankenfont"] + test_args)
 
-    def mock_install_font(font_path):
-        assert font_path == output_path
-        print("Mock installation successful for:", font_path)
+    def mock_install_fonts(font_paths, system):
+        assert font_paths == [output_path]
+        assert not system
+        print("Mock installation successful for:", font_paths)
 
-    monkeypatch.setattr("frankenfont.create.install_font", mock_install_font)
+    monkeypatch.setattr("frankenfont.install.install_fonts", mock_install_fonts)
     main()
     captured = capsys.readouterr()
     assert "Custom font saved to" in captured.out
     assert "Mock installation successful" in captured.out
+
+
+def test_cli_install_command(monkeypatch):
+    fonts = ["a.ttf", "b.ttf"]
+    monkeypatch.setattr("sys.argv", ["frankenfont", "install", *fonts, "--system"])
+    calls = []
+    monkeypatch.setattr(
+        "frankenfont.install.install_fonts",
+        lambda font_paths, system: calls.append((font_paths, system)),
+    )
+    main()
+    assert calls == [(fonts, True)]
+
+
+def test_cli_preview_specimen_command(monkeypatch):
+    test_args = ["preview", CONFIG_PATH, "--specimen", "out", "--columns", "8"]
+    monkeypatch.setattr("sys.argv", ["frankenfont"] + test_args)
+    calls = []
+    monkeypatch.setattr(
+        "frankenfont.preview.write_specimen",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
+    main()
+    assert calls == [
+        (
+            (CONFIG_PATH, "out"),
+            {"columns": 8, "rows": 16, "cell_size": 80, "workers": None},
+        )
+    ]
+
+
+@pytest.mark.parametrize("option", ["--rows", "--columns", "--cell-size", "--workers"])
+def test_cli_preview_rejects_non_positive(monkeypatch, option):
+    monkeypatch.setattr("sys.argv", ["frankenfont", "preview", CONFIG_PATH, option, "0"])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+
+
+# Extra wall time `frankenfont --help` may take over a bare interpreter start
+STARTUP_BUDGET = 0.05
+HEAVY_MODULES = ("fontTools", "PIL", "toml", "logging")
+
+
+def run_cli(*args):
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1] / "src"))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def best_time(*args, repeat=10):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_cli(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.parametrize("command", [[], ["create"], ["install"], ["preview"]])
+def test_cli_help_does_not_import_heavy_modules(command):
+    """Test `--help` never loads fontTools, Pillow, toml or logging"""
+    result = run_cli("-X", "importtime", "-m", "frankenfont.cli", *command, "--help")
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    for module in HEAVY_MODULES:
+        assert not any(
+            name == module or name.startswith(f"{module}.") for name in imported
+        ), f"{module} imported on startup"
+
+
+@pytest.mark.skipif(
+    not os.environ.get("FRANKENFONT_BENCH"),
+    reason="wall-clock benchmark, set FRANKENFONT_BENCH=1 to run",
+)
+def test_cli_startup_time():
+    """Benchmark cold start of `frankenfont --help` against the startup budget"""
+    baseline = best_time("-c", "pass")
+    startup = best_time("-m", "frankenfont.cli", "--help")
+    assert startup - baseline < STARTUP_BUDGET, (
+        f"CLI startup took {startup - baseline:.3f}s over interpreter start"
+    )
+
+
 import pytest
 from unittest import mock
 from pathlib import Path
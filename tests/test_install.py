@@ -0,0 +1,106 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from frankenfont import install
+from frankenfont.install import font_directory, install_fonts
+
+
+@pytest.fixture
+def font_dir(tmp_path, monkeypatch):
+    """Point the per-user Linux font directory into a temporary directory"""
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    return tmp_path / "data" / "fonts"
+
+
+@pytest.fixture
+def fonts(tmp_path):
+    paths = []
+    for name in ("one.ttf", "two.ttf"):
+        path = tmp_path / name
+        path.write_bytes(name.encode() * 100)
+        paths.append(str(path))
+    return paths
+
+
+def test_font_directory_expands_home(monkeypatch):
+    """Test the macOS user directory is an expanded absolute path"""
+    monkeypatch.setattr("platform.system", lambda: "Darwin")
+    assert font_directory() == os.path.expanduser("~/Library/Fonts")
+    assert font_directory(system=True) == "/Library/Fonts"
+
+
+def test_install_fonts_copies_and_refreshes_once(font_dir, fonts):
+    """Test a batch install copies every font and refreshes the cache once"""
+    with patch("frankenfont.install.refresh_font_cache") as mock_refresh:
+        installed = install_fonts(fonts)
+    assert installed == [str(font_dir / "one.ttf"), str(font_dir / "two.ttf")]
+    assert (font_dir / "one.ttf").read_bytes() == b"one.ttf" * 100
+    mock_refresh.assert_called_once_with(str(font_dir))
+    assert not [p for p in os.listdir(font_dir) if p.endswith(".tmp")]
+
+
+def test_install_fonts_skips_identical(font_dir, fonts):
+    """Test fonts already installed with identical content are skipped"""
+    with patch("frankenfont.install.refresh_font_cache") as mock_refresh:
+        install_fonts(fonts)
+        mock_refresh.reset_mock()
+        assert install_fonts(fonts) == []
+        mock_refresh.assert_not_called()
+
+        with open(fonts[1], "ab") as f:
+            f.write(b"changed")
+        assert install_fonts(fonts) == [str(font_dir / "two.ttf")]
+        mock_refresh.assert_called_once_with(str(font_dir))
+
+
+def test_install_fonts_rejects_duplicate_names(font_dir, tmp_path, fonts):
+    """Test fonts sharing a file name are rejected before anything is copied"""
+    other = tmp_path / "other" / "one.ttf"
+    other.parent.mkdir()
+    other.write_bytes(b"other")
+    with pytest.raises(ValueError, match="one.ttf"):
+        install_fonts([*fonts, str(other)])
+    assert not font_dir.exists() or not os.listdir(font_dir)
+
+
+def test_install_fonts_rejects_missing_before_copying(font_dir, tmp_path, fonts):
+    """Test a batch with a missing font fails before anything is copied"""
+    with patch("frankenfont.install.refresh_font_cache") as mock_refresh:
+        with pytest.raises(FileNotFoundError, match="nope.ttf"):
+            install_fonts([fonts[0], str(tmp_path / "nope.ttf")])
+        with pytest.raises(FileNotFoundError):
+            install_fonts([fonts[0], str(tmp_path)])
+    assert not font_dir.exists() or not os.listdir(font_dir)
+    mock_refresh.assert_not_called()
+
+
+def test_install_fonts_refreshes_after_failed_copy(font_dir, fonts):
+    """Test fonts copied before a failure still get the cache refresh"""
+    copy_atomic = install.copy_atomic
+
+    def fail_second(font_path, target_path):
+        if font_path == fonts[1]:
+            raise PermissionError(target_path)
+        copy_atomic(font_path, target_path)
+
+    with patch("frankenfont.install.copy_atomic", side_effect=fail_second), \
+            patch("frankenfont.install.refresh_font_cache") as mock_refresh:
+        with pytest.raises(PermissionError):
+            install_fonts(fonts)
+    assert (font_dir / "one.ttf").exists()
+    mock_refresh.assert_called_once_with(str(font_dir))
+
+
+def test_install_fonts_registers_on_windows(tmp_path, monkeypatch, fonts):
+    """Test per-user Windows installs are registered after copying"""
+    monkeypatch.setattr("platform.system", lambda: "Windows")
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "appdata"))
+    with patch("frankenfont.install.register_windows_font") as mock_register, \
+            patch("frankenfont.install.refresh_font_cache"):
+        installed = install_fonts(fonts)
+    assert [call.args for call in mock_register.call_args_list] == [
+        (path, False) for path in installed
+    ]
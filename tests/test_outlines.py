@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+from frankenfont.create import merge_glyphs
+from frankenfont.hashing import file_hash
+from frankenfont.outlines import cache_path, load_cff_glyph
+
+
+def draw_circle(pen):
+    pen.moveTo((100, 300))
+    pen.curveTo((100, 410), (190, 500), (300, 500))
+    pen.curveTo((410, 500), (500, 410), (500, 300))
+    pen.curveTo((500, 190), (410, 100), (300, 100))
+    pen.curveTo((190, 100), (100, 190), (100, 300))
+    pen.closePath()
+
+
+def build_cff_font(path, cff2=False):
+    """Build a minimal CFF- or CFF2-flavored font mapping U+25CF to a circle"""
+    fb = FontBuilder(1000, isTTF=False)
+    fb.setupGlyphOrder([".notdef", "circle"])
+    fb.setupCharacterMap({0x25CF: "circle"})
+    charstrings = {}
+    for name in (".notdef", "circle"):
+        pen = T2CharStringPen(None if cff2 else 600, None, CFF2=cff2)
+        if name == "circle":
+            draw_circle(pen)
+        charstrings[name] = pen.getCharString()
+    if cff2:
+        fb.setupCFF2(charstrings)
+    else:
+        fb.setupCFF("TestSymbols", {}, charstrings, {})
+    fb.setupHorizontalMetrics({".notdef": (600, 0), "circle": (600, 100)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "TestSymbols", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def cff_font_path(tmp_path):
+    return build_cff_font(tmp_path / "symbols.otf")
+
+
+@pytest.fixture
+def base_font(tmp_path):
+    """Build a minimal TrueType base font"""
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef"])
+    fb.setupCharacterMap({})
+    fb.setupGlyf({".notdef": TTGlyphPen(None).glyph()})
+    fb.setupHorizontalMetrics({".notdef": (600, 0)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "TestBase", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    path = tmp_path / "base.ttf"
+    fb.save(str(path))
+    return TTFont(str(path))
+
+
+def test_load_cff_glyph_is_quadratic_and_cached(cff_font_path, tmp_path):
+    """Test CFF glyphs are converted once and then served from the cache"""
+    cache_dir = str(tmp_path / "cache")
+    source_hash = file_hash(cff_font_path)
+    font = TTFont(cff_font_path)
+
+    glyph = load_cff_glyph(font, source_hash, "circle", 1.0, cache_dir)
+    glyph.expand(None)
+    assert glyph.numberOfContours == 1
+    assert not all(glyph.flags[i] & 1 for i in range(len(glyph.flags)))
+    assert cache_path(cache_dir, source_hash, "circle", 1).exists()
+
+    with patch("frankenfont.outlines.convert_cff_glyph") as mock_convert:
+        cached = load_cff_glyph(font, source_hash, "circle", 1.0, cache_dir)
+        mock_convert.assert_not_called()
+    cached.expand(None)
+    assert list(cached.coordinates) == list(glyph.coordinates)
+    font.close()
+
+
+def test_cache_keyed_by_tolerance(cff_font_path, tmp_path):
+    """Test different tolerances produce separate cache entries"""
+    cache_dir = str(tmp_path / "cache")
+    source_hash = file_hash(cff_font_path)
+    font = TTFont(cff_font_path)
+    load_cff_glyph(font, source_hash, "circle", 1.0, cache_dir)
+    load_cff_glyph(font, source_hash, "circle", 5.0, cache_dir)
+    assert len(list((tmp_path / "cache" / source_hash).iterdir())) == 2
+    font.close()
+
+
+def test_corrupt_cache_entry_is_reconverted(cff_font_path, tmp_path):
+    """Test an undecodable cache entry is treated as a miss"""
+    cache_dir = str(tmp_path / "cache")
+    source_hash = file_hash(cff_font_path)
+    font = TTFont(cff_font_path)
+    path = cache_path(cache_dir, source_hash, "circle", 1.0)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"\x00\x01\x00")
+
+    glyph = load_cff_glyph(font, source_hash, "circle", 1.0, cache_dir)
+    glyph.expand(None)
+    assert glyph.numberOfContours == 1
+    rewritten = Glyph(path.read_bytes())
+    rewritten.expand(None)
+    assert rewritten.numberOfContours == 1
+    font.close()
+
+
+def test_failed_cache_write_leaves_no_temp_file(cff_font_path, tmp_path):
+    """Test the temporary file is removed when the cache write fails"""
+    cache_dir = str(tmp_path / "cache")
+    source_hash = file_hash(cff_font_path)
+    font = TTFont(cff_font_path)
+    with patch("os.replace", side_effect=OSError), pytest.raises(OSError):
+        load_cff_glyph(font, source_hash, "circle", 1.0, cache_dir)
+    assert list((tmp_path / "cache" / source_hash).iterdir()) == []
+    font.close()
+
+
+@pytest.mark.parametrize("cff2", [False, True])
+def test_merge_glyphs_from_cff_source(base_font, tmp_path, cff2):
+    """Test only requested glyphs are merged from a CFF or CFF2 source font"""
+    cff_font_path = build_cff_font(tmp_path / "symbols.otf", cff2)
+    cache_dir = str(tmp_path / "cache")
+    merge_glyphs(base_font, cff_font_path, ["●", "x"], cache_dir=cache_dir)
+
+    output_path = tmp_path / "merged.ttf"
+    base_font.save(str(output_path))
+    merged = TTFont(str(output_path))
+    assert merged.getBestCmap()[0x25CF] == "circle"
+    assert merged["glyf"]["circle"].numberOfContours == 1
+    assert merged["hmtx"]["circle"] == (600, 100)
+    merged.close()
@@ -1,10 +1,16 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, mock_open, MagicMock
 from pathlib import Path
 import sys
 from PIL import Image, ImageFont
 
-from src.frankenfont.preview import preview_config, load_config, get_font_name
+from src.frankenfont.preview import (
+    collect_specimen_glyphs,
+    get_font_name,
+    load_config,
+    preview_config,
+    write_specimen,
+)
 
 @pytest.fixture
 def mock_image():
@@ -26,7 +32,8 @@ def mock_imagefont():
 ])
 def test_load_config_file_types(config_path, expected_ext):
     """Test loading different config file types"""
-    with patch(f"{'json' if expected_ext == 'json' else 'toml'}.load") as mock_load:
+    with patch(f"{'json' if expected_ext == 'json' else 'tomllib'}.load") as mock_load, \
+            patch("builtins.open", mock_open()):
         mock_load.return_value = {"fonts": {"base": "test.ttf"}}
         load_config(config_path)
         mock_load.assert_called_once()
@@ -68,3 +75,85 @@ def test_preview_cleanup(mock_unlink, mock_tempfile, mock_image):
     preview_config("test_config.toml")
     
     mock_unlink.assert_called_once_with("temp.png")
+
+def test_collect_specimen_glyphs_ordered_by_code_point():
+    """Test specimen glyphs are sorted and later replacements win"""
+    config = {
+        "replacements": [
+            {"font": "a.ttf", "glyphs": ["z", "™", "!"]},
+            {"font": "b.ttf", "glyphs": ["!", "glyph_name"]},
+        ]
+    }
+    entries = collect_specimen_glyphs(config, Path("fonts"))
+    assert entries == [
+        (ord("!"), str(Path("fonts") / "b.ttf")),
+        (ord("z"), str(Path("fonts") / "a.ttf")),
+        (ord("™"), str(Path("fonts") / "a.ttf")),
+    ]
+
+def test_write_specimen_tiles(tmp_path):
+    """Test the specimen grid is split into tiles written to disk"""
+    config_path = tmp_path / "config.toml"
+    glyphs = ", ".join(f'"{chr(c)}"' for c in range(0x2600, 0x2600 + 40))
+    config_path.write_text(
+        f'[fonts]\nbase = "base.ttf"\n\n[[replacements]]\nfont = "sym.ttf"\nglyphs = [{glyphs}]\n'
+    )
+    output_dir = tmp_path / "specimen"
+    default_font = ImageFont.load_default(20)
+
+    with patch("PIL.ImageFont.truetype", return_value=default_font):
+        tile_paths = write_specimen(
+            str(config_path), str(output_dir), columns=4, rows=4, cell_size=40, workers=2
+        )
+
+    assert tile_paths == [
+        str(output_dir / f"specimen_{i:04d}.png") for i in range(3)
+    ]
+    with Image.open(tile_paths[0]) as tile:
+        assert tile.size == (160, 160)
+    with Image.open(tile_paths[-1]) as tile:
+        assert tile.size == (160, 80)
+
+@pytest.mark.parametrize("kwargs", [
+    {"columns": 0},
+    {"rows": 0},
+    {"rows": -1},
+    {"cell_size": 4},
+])
+def test_write_specimen_rejects_invalid_grid(kwargs, tmp_path):
+    """Test non-positive grid sizes and tiny cells are rejected up front"""
+    with pytest.raises(ValueError):
+        write_specimen("test_config.toml", str(tmp_path), **kwargs)
+
+def test_write_specimen_label_font_relative_to_config(tmp_path, caplog):
+    """Test the label font resolves against the config directory and warns on fallback"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        '[fonts]\nbase = "base.ttf"\n\n[[replacements]]\nfont = "sym.ttf"\nglyphs = ["☀"]\n'
+    )
+    default_font = ImageFont.load_default(20)
+
+    def truetype(path, size, **kwargs):
+        if path == str(tmp_path / "base.ttf"):
+            raise OSError
+        return default_font
+
+    with patch("PIL.ImageFont.truetype", side_effect=truetype) as mock_truetype:
+        write_specimen(str(config_path), str(tmp_path / "specimen"))
+
+    loaded = [call.args[0] for call in mock_truetype.call_args_list]
+    assert str(tmp_path / "base.ttf") in loaded
+    assert "Error loading label font" in caplog.text
+
+def test_write_specimen_missing_replacement_font(tmp_path, caplog):
+    """Test a missing replacement font exits before any tile is rendered"""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        '[fonts]\nbase = "base.ttf"\n\n[[replacements]]\nfont = "missing.ttf"\nglyphs = ["☀"]\n'
+    )
+    with patch("src.frankenfont.preview.render_specimen_tile") as mock_render:
+        with pytest.raises(SystemExit) as exc_info:
+            write_specimen(str(config_path), str(tmp_path / "specimen"))
+    assert exc_info.value.code == 1
+    mock_render.assert_not_called()
+    assert f"Error loading replacement font from {tmp_path / 'missing.ttf'}" in caplog.text